@@ -6,8 +6,9 @@ Based on HAR file analysis - uses the 'bookings' query with pagination
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import time
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Optional, Tuple
 from fixed_graphql_client import FixedEliaGraphQLClient
 import os
 
@@ -18,124 +19,103 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+# Number of bookings requested per page of the bookings connection
+BOOKINGS_PAGE_SIZE = 100
+
 class CorrectBookingDetector:
     """
     Booking detector using the actual Elia API query discovered from HAR file
     """
     
-    def __init__(self, client: FixedEliaGraphQLClient):
+    def __init__(self, client: FixedEliaGraphQLClient, cache_ttl: float = 60.0):
         self.client = client
         self.user_email = os.getenv('ELIA_EMAIL', '')
         self.logger = logging.getLogger(__name__)
+        
+        # Cache of (fetched_at, bookings) so repeated date checks share one fetch
+        self.cache_ttl = cache_ttl
+        self._cache: Optional[Tuple[float, List[Dict]]] = None
+        
+        # Parking bookings indexed by date, paired with the list it was built from
+        self._parking_index: Optional[Tuple[List[Dict], Dict[str, List[Dict]]]] = None
     
     async def get_all_upcoming_bookings(self) -> List[Dict]:
         """
         Get all upcoming bookings using the correct API query
-        This is the exact query the Elia web app uses
+        Same query the Elia web app uses, trimmed to the fields read here
+        Results are cached for cache_ttl seconds
         """
+        if self._cache and time.monotonic() - self._cache[0] < self.cache_ttl:
+            return self._cache[1]
+        
         query = """
         query searchUpcomingBookings($first: Int, $after: ID) {
           bookings(first: $first, after: $after) {
             edges {
               node {
                 id
-                neighbourhoodId
                 unit {
                   id
                   name
-                  type
-                  capacity
                   location {
-                    building {
-                      id
-                      name
-                      __typename
-                    }
                     floor {
-                      id
-                      name
-                      __typename
-                    }
-                    sector {
-                      id
-                      name
-                      __typename
-                    }
-                    __typename
-                  }
-                  place {
-                    room {
-                      id
-                      name
-                      __typename
-                    }
-                    row {
-                      id
-                      name
-                      __typename
-                    }
-                    desk {
-                      id
                       name
-                      __typename
                     }
-                    __typename
                   }
                   tags {
-                    id
                     name
-                    backgroundColor
-                    textColor
-                    __typename
                   }
-                  __typename
                 }
                 start
                 end
-                __typename
               }
-              __typename
             }
             pageInfo {
-              hasPreviousPage
               hasNextPage
-              startCursor
               endCursor
-              __typename
             }
-            __typename
           }
         }
         """
         
-        variables = {
-            "first": 1000000  # Get all bookings
-        }
+        bookings = []
+        after = None
         
         try:
-            result = await self.client.execute_query(query, variables, "searchUpcomingBookings")
-            
-            if result and "data" in result:
+            # Walk the connection page by page using the cursor
+            while True:
+                variables = {"first": BOOKINGS_PAGE_SIZE}
+                if after:
+                    variables["after"] = after
+                
+                result = await self.client.execute_query(query, variables, "searchUpcomingBookings")
+                
+                if not result or "data" not in result:
+                    self.logger.warning(f"No data in response. Response keys: {list(result.keys()) if result else 'None'}")
+                    return []
+                
                 data = result["data"]
                 
-                if "bookings" in data:
-                    bookings_data = data["bookings"]
-                    edges = bookings_data.get("edges", [])
-                    
-                    bookings = []
-                    for edge in edges:
-                        node = edge.get("node", {})
-                        if node:
-                            bookings.append(node)
-                    
-                    self.logger.info(f"Retrieved {len(bookings)} total bookings")
-                    return bookings
-                else:
+                if "bookings" not in data:
                     self.logger.warning(f"No 'bookings' field in data. Available fields: {list(data.keys())}")
                     return []
-            else:
-                self.logger.warning(f"No data in response. Response keys: {list(result.keys()) if result else 'None'}")
-                return []
+                
+                bookings_data = data["bookings"]
+                
+                for edge in bookings_data.get("edges", []):
+                    node = edge.get("node", {})
+                    if node:
+                        bookings.append(node)
+                
+                page_info = bookings_data.get("pageInfo", {})
+                after = page_info.get("endCursor")
+                
+                if not page_info.get("hasNextPage") or not after:
+                    break
+            
+            self.logger.info(f"Retrieved {len(bookings)} total bookings")
+            self._cache = (time.monotonic(), bookings)
+            return bookings
                 
         except Exception as e:
             self.logger.error(f"Failed to get bookings: {e}")
@@ -177,14 +157,54 @@ class CorrectBookingDetector:
         if not start_time:
             return None
         
+        booking_date = self._parse_start_date(start_time)
+        return booking_date.isoformat() if booking_date else None
+    
+    def _parse_start_date(self, start_time: str) -> Optional[date]:
+        """
+        Parse the local date of an ISO start time
+        ISO format: "2025-12-12T06:00:00.000-05:00" - the first 10 characters
+        are already the date in the booking's own offset
+        """
         try:
-            # Parse ISO format: "2025-12-12T06:00:00.000-05:00"
-            dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-            return dt.strftime("%Y-%m-%d")
-        except Exception as e:
+            return date.fromisoformat(start_time[:10])
+        except ValueError as e:
             self.logger.error(f"Failed to parse date from {start_time}: {e}")
             return None
     
+    def _classify(self, booking: Dict) -> Tuple[bool, Optional[date]]:
+        """
+        Classify a booking in a single pass
+        Returns (is_parking, booking_date); the date is only parsed for parking bookings
+        """
+        if not self.is_parking_booking(booking):
+            return False, None
+        
+        start_time = booking.get("start", "")
+        if not start_time:
+            return True, None
+        
+        return True, self._parse_start_date(start_time)
+    
+    async def _get_parking_by_date(self) -> Dict[str, List[Dict]]:
+        """
+        Get parking bookings grouped by YYYY-MM-DD date
+        The index is rebuilt only when the underlying bookings list changes
+        """
+        bookings = await self.get_all_upcoming_bookings()
+        
+        if self._parking_index and self._parking_index[0] is bookings:
+            return self._parking_index[1]
+        
+        parking_by_date = {}
+        for booking in bookings:
+            is_parking, booking_date = self._classify(booking)
+            if is_parking and booking_date:
+                parking_by_date.setdefault(booking_date.isoformat(), []).append(booking)
+        
+        self._parking_index = (bookings, parking_by_date)
+        return parking_by_date
+    
     async def has_booking_for_date(self, date_str: str) -> bool:
         """
         Check if there's a parking booking for a specific date
@@ -195,22 +215,31 @@ class CorrectBookingDetector:
         Returns:
             True if parking booking exists for this date
         """
-        bookings = await self.get_all_upcoming_bookings()
+        day_bookings = (await self._get_parking_by_date()).get(date_str)
         
-        # Filter for parking bookings on the specified date
-        for booking in bookings:
-            if self.is_parking_booking(booking):
-                booking_date = self.get_booking_date(booking)
-                
-                if booking_date == date_str:
-                    unit = booking.get("unit", {})
-                    unit_name = unit.get("name", "Unknown")
-                    
-                    self.logger.info(f"Found parking booking on {date_str}: {unit_name}")
-                    return True
+        if day_bookings:
+            unit = day_bookings[0].get("unit", {})
+            unit_name = unit.get("name", "Unknown")
+            
+            self.logger.info(f"Found parking booking on {date_str}: {unit_name}")
+            return True
         
         return False
     
+    async def has_bookings_for_dates(self, dates: List[str]) -> Dict[str, bool]:
+        """
+        Check several dates for parking bookings with a single fetch
+        
+        Args:
+            dates: Dates in YYYY-MM-DD format
+            
+        Returns:
+            Dictionary mapping each date to True if a parking booking exists
+        """
+        parking_by_date = await self._get_parking_by_date()
+        
+        return {date_str: date_str in parking_by_date for date_str in dates}
+    
     async def get_parking_bookings_in_range(self, start_date: str, end_date: str) -> List[Dict]:
         """
         Get all parking bookings within a date range
@@ -224,29 +253,25 @@ class CorrectBookingDetector:
         """
         bookings = await self.get_all_upcoming_bookings()
         
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+        start_dt = date.fromisoformat(start_date)
+        end_dt = date.fromisoformat(end_date)
         
         parking_bookings = []
         
         for booking in bookings:
-            if self.is_parking_booking(booking):
-                booking_date_str = self.get_booking_date(booking)
+            is_parking, booking_dt = self._classify(booking)
+            
+            if is_parking and booking_dt and start_dt <= booking_dt <= end_dt:
+                unit = booking.get("unit", {})
                 
-                if booking_date_str:
-                    booking_dt = datetime.strptime(booking_date_str, "%Y-%m-%d")
-                    
-                    if start_dt <= booking_dt <= end_dt:
-                        unit = booking.get("unit", {})
-                        
-                        parking_bookings.append({
-                            "date": booking_date_str,
-                            "unit_name": unit.get("name", "Unknown"),
-                            "unit_id": unit.get("id", ""),
-                            "start": booking.get("start", ""),
-                            "end": booking.get("end", ""),
-                            "booking_id": booking.get("id", "")
-                        })
+                parking_bookings.append({
+                    "date": booking_dt.isoformat(),
+                    "unit_name": unit.get("name", "Unknown"),
+                    "unit_id": unit.get("id", ""),
+                    "start": booking.get("start", ""),
+                    "end": booking.get("end", ""),
+                    "booking_id": booking.get("id", "")
+                })
         
         return sorted(parking_bookings, key=lambda x: x["date"])
 
@@ -287,8 +312,9 @@ async def test_correct_detector():
         "2025-12-13",  # Should NOT have booking
     ]
     
-    for date in test_dates:
-        has_booking = await detector.has_booking_for_date(date)
+    date_results = await detector.has_bookings_for_dates(test_dates)
+    
+    for date, has_booking in date_results.items():
         status = "HAS BOOKING" if has_booking else "NO BOOKING"
         print(f"  {date}: {status}")
     
@@ -6,6 +6,7 @@ Based on actual captured queries from Elia application
 import asyncio
 import httpx
 import json
+import orjson
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 from loguru import logger
@@ -15,6 +16,12 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Keywords that identify a parking space by name or place type
+PARKING_KEYWORDS = (
+    'parking', 'spot', 'place', 'stationnement',
+    'p', 'pk', 'st', 'ps'
+)
+
 
 class FixedEliaGraphQLClient:
     """
@@ -281,11 +288,12 @@ class FixedEliaGraphQLClient:
         try:
             logger.info(f"🔍 Finding available parking spots for {date}...")
             
-            # Get all parking spaces on the floor
-            all_spaces = await self.get_floor_spaces(floor_id)
-            
-            # Get already booked spaces for this date
-            booked_space_ids = await self.get_floor_plan_bookings(floor_id, date)
+            # Fetch floor spaces and already booked spaces concurrently
+            all_spaces, booked_space_ids = await asyncio.gather(
+                self.get_floor_spaces(floor_id),
+                self.get_floor_plan_bookings(floor_id, date)
+            )
+            booked_space_ids = set(booked_space_ids)  # O(1) lookups
             
             # Filter out already booked spaces
             available_spaces = [
@@ -309,14 +317,8 @@ class FixedEliaGraphQLClient:
         name = space.get('name', '').lower()
         place_type = space.get('placeType', '').lower()
         
-        # Check for parking-related keywords
-        parking_keywords = [
-            'parking', 'spot', 'place', 'stationnement',
-            'p', 'pk', 'st', 'ps'
-        ]
-        
-        # Check name and type
-        for keyword in parking_keywords:
+        # Check name and type for parking-related keywords
+        for keyword in PARKING_KEYWORDS:
             if keyword in name or keyword in place_type:
                 return True
         
@@ -355,7 +357,7 @@ class FixedEliaGraphQLClient:
             )
             
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Check for GraphQL errors
             if 'errors' in data:
@@ -26,6 +26,7 @@ class ProductionEliaBot:
     def __init__(self):
         self.client = FixedEliaGraphQLClient()
         self.floor_id = "sp_Mkddt7JNKkLPhqTc"  # Default parking floor
+        self.booking_detector = None  # Created on first booking check
         
         logger.info("🤖 ProductionEliaBot initialized")
     
@@ -242,9 +243,11 @@ class ProductionEliaBot:
         try:
             from correct_booking_detector import CorrectBookingDetector
             
-            detector = CorrectBookingDetector(client=self.client)
+            # Reuse one detector so its bookings cache spans every date checked
+            if self.booking_detector is None:
+                self.booking_detector = CorrectBookingDetector(client=self.client)
             
-            has_booking = await detector.has_booking_for_date(date_str)
+            has_booking = await self.booking_detector.has_booking_for_date(date_str)
             
             if has_booking:
                 logger.info(f"📅 Existing booking detected for {date_str} - will skip")
@@ -710,8 +713,8 @@ class ProductionEliaBot:
             # Get all spaces
             all_spaces = await self.client.get_floor_spaces(self.floor_id)
             
-            # Get booked spaces
-            booked_space_ids = await self.client.get_floor_plan_bookings(date, self.floor_id)
+            # Get booked spaces (set for O(1) lookups)
+            booked_space_ids = set(await self.client.get_floor_plan_bookings(date, self.floor_id))
             
             # Calculate statistics
             total_spaces = len(all_spaces)